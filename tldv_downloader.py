@@ -6,45 +6,97 @@ Enhanced version with better error handling, filename sanitization, and N_m3u8DL
 
 import re
 import json
+import os
+import queue
 import requests
+import shutil
 import subprocess
 import sys
+import threading
+import urllib3
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster metadata serialization
+    orjson = None
+
+# Characters that are invalid in filenames on at least one supported platform
+_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+# Written to the output directory after a batch run that had failures
+_FAILED_URLS_FILENAME = "failed_urls.txt"
+
+# Upper bound on concurrent API requests while resolving a batch
+_MAX_METADATA_WORKERS = 32
+
+# Floor for the default number of parallel downloads in batch mode
+_MIN_DEFAULT_WORKERS = 16
+
+# Upper bound on N_m3u8DL-RE segment download threads per process
+_MAX_SEGMENT_THREADS = 32
 
 
 class TLDVDownloader:
+    # Downloader detected by check_downloader_availability, shared by all instances
+    _downloader = None
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        self._pool_size = None
+        self.configure_connection_pool()
+
+    def configure_connection_pool(self, max_workers=1):
+        """Mount a pooled HTTPS adapter sized for the given number of parallel workers"""
+        if self._pool_size == max_workers:
+            return  # Keep the current adapter and its open connections
+
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 2,
+            # Retry transient failures; the final response is still checked by raise_for_status
+            max_retries=Retry(
+                total=5,
+                connect=3,
+                read=3,
+                status=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods={'GET'},
+                raise_on_status=False
+            )
+        )
+        # Release the replaced adapter's pooled sockets now rather than at garbage collection
+        self.session.get_adapter('https://').close()
+        self.session.mount('https://', adapter)
+        self._pool_size = max_workers
 
     def sanitize_filename(self, name):
         """Remove invalid characters from filename"""
         # Remove invalid characters and replace with underscores
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
+        sanitized = name.translate(_INVALID_CHARS_TABLE)
         # Remove multiple consecutive underscores
-        sanitized = re.sub(r'_{2,}', '_', sanitized)
-        # Remove leading/trailing underscores and spaces
-        sanitized = sanitized.strip('_ ')
-        # Limit length to avoid filesystem issues
-        if len(sanitized) > 100:
-            sanitized = sanitized[:100]
+        sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
+        # Remove leading/trailing underscores and spaces, and limit length to avoid filesystem issues
+        sanitized = sanitized.strip('_ ')[:100]
         return sanitized or "TLDV_Meeting"
 
     def extract_meeting_id(self, url):
         """Extract meeting ID from TLDV URL"""
         url = url.strip().rstrip('/')
-        try:
-            meeting_id = url.split('/')[-1]
-            # Basic validation for meeting ID format
-            if len(meeting_id) < 10:
-                raise ValueError("Invalid meeting ID format")
-            return meeting_id
-        except (IndexError, ValueError) as e:
-            raise ValueError(f"Could not extract meeting ID from URL: {url}") from e
+        meeting_id = url.rsplit('/', 1)[-1]
+        # Basic validation for meeting ID format
+        if len(meeting_id) < 10:
+            raise ValueError(f"Could not extract meeting ID from URL: {url}")
+        return meeting_id
 
     def prepare_auth_token(self, token):
         """Ensure auth token has Bearer prefix if needed"""
@@ -77,6 +129,26 @@ class TLDVDownloader:
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Network error: {e}") from e
 
+    def warm_up_connection(self):
+        """Resolve DNS and open a pooled TLS connection to the API ahead of the first fetch"""
+        url = "https://gw.tldv.io/"
+        try:
+            # Pick the pool exactly as session.get would (same TLS settings and proxy
+            # routing), but send with retries disabled so a failed warm-up costs at
+            # most one short timeout instead of the full Retry policy
+            request = self.session.prepare_request(requests.Request('HEAD', url))
+            settings = self.session.merge_environment_settings(url, {}, None, None, None)
+            adapter = self.session.get_adapter(url)
+            pool = adapter.get_connection_with_tls_context(
+                request, settings['verify'], proxies=settings['proxies'], cert=settings['cert']
+            )
+            pool.urlopen(
+                'HEAD', adapter.request_url(request, settings['proxies']), headers=request.headers,
+                retries=False, redirect=False, timeout=5
+            )
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError):
+            pass  # Best effort only; fetch_meeting_data reports real network errors
+
     def parse_meeting_info(self, data):
         """Parse meeting information from API response"""
         meeting = data.get("meeting", {})
@@ -89,14 +161,17 @@ class TLDVDownloader:
         if not source_url:
             raise ValueError("Video source URL not found in meeting data")
 
-        # Parse date
+        # Parse date (fromisoformat only accepts a trailing 'Z' from Python 3.11)
         try:
             if created_at:
-                date_obj = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%S.%fZ")
+                date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
             else:
                 date_obj = datetime.now()
         except ValueError:
-            date_obj = datetime.now()
+            try:
+                date_obj = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%S.%fZ")
+            except ValueError:
+                date_obj = datetime.now()
 
         timestamp = date_obj.strftime("%Y-%m-%d_%H-%M-%S")
         sanitized_name = self.sanitize_filename(name)
@@ -109,7 +184,10 @@ class TLDVDownloader:
         }
 
     def check_downloader_availability(self):
-        """Check if N_m3u8DL-RE or ffmpeg is available"""
+        """Check if N_m3u8DL-RE or ffmpeg is available (probed once per process)"""
+        if TLDVDownloader._downloader is not None:
+            return TLDVDownloader._downloader
+
         downloaders = [
             {'name': 'N_m3u8DL-RE', 'cmd': 'N_m3u8DL-RE', 'version_cmd': '--version', 'preferred': True},
             {'name': 'ffmpeg', 'cmd': 'ffmpeg', 'version_cmd': '--version', 'preferred': False},
@@ -118,16 +196,26 @@ class TLDVDownloader:
 
         available = []
         for downloader in downloaders:
+            cmd_path = shutil.which(downloader['cmd'])
+            if not cmd_path:
+                print(f"❌ {downloader['name']} not found")
+                continue
             try:
+                # An absolute path, discarded streams and close_fds=False (our fds are
+                # non-inheritable anyway) let subprocess use posix_spawn instead of fork
                 result = subprocess.run(
-                    [downloader['cmd'], downloader['version_cmd']],
-                    capture_output=True,
-                    text=True,
+                    [cmd_path, downloader['version_cmd']],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
                     timeout=10
                 )
                 if result.returncode == 0:
                     available.append(downloader)
                     print(f"✅ {downloader['name']} is available")
+                    if downloader['preferred']:
+                        break
                 else:
                     print(f"❌ {downloader['name']} not working properly")
             except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
@@ -138,24 +226,31 @@ class TLDVDownloader:
 
         # Return preferred downloader (N_m3u8DL-RE if available)
         preferred = next((d for d in available if d['preferred']), available[0])
+        TLDVDownloader._downloader = preferred
         return preferred
 
-    def download_with_n_m3u8dl_re(self, source_url, output_file):
-        """Download using N_m3u8DL-RE"""
+    def download_with_n_m3u8dl_re(self, source_url, output_file, quiet=False, thread_count=None):
+        """Download using N_m3u8DL-RE to output_file (a Path)"""
+        if not thread_count:
+            thread_count = min(_MAX_SEGMENT_THREADS, (os.cpu_count() or 4) * 4)
+
         command = [
             'N_m3u8DL-RE',
             source_url,
-            '--save-name', Path(output_file).stem,
-            '--save-dir', str(Path(output_file).parent),
-            '--thread-count', '8',  # Parallel downloads
+            '--save-name', output_file.stem,
+            '--save-dir', str(output_file.parent),
+            '--thread-count', str(thread_count),  # Parallel segment downloads
             '--download-retry-count', '3',
             '--auto-select',  # Auto select best quality
-            '--no-log'  # Reduce log verbosity
+            '--no-log'  # Don't write a log file
         ]
+        if quiet:
+            # Output is discarded anyway, so skip rendering progress on the console
+            command += ['--log-level', 'OFF']
 
-        return self._run_download_command(command, output_file)
+        return self._run_download_command(command, output_file, quiet)
 
-    def download_with_ffmpeg(self, source_url, output_file):
+    def download_with_ffmpeg(self, source_url, output_file, quiet=False):
         """Download using ffmpeg"""
         command = [
             'ffmpeg',
@@ -165,33 +260,39 @@ class TLDVDownloader:
             str(output_file)
         ]
 
-        return self._run_download_command(command, output_file)
+        return self._run_download_command(command, output_file, quiet)
+
+    def _run_download_command(self, command, output_file, quiet=False):
+        """Run download command with progress tracking
 
-    def _run_download_command(self, command, output_file):
-        """Run download command with progress tracking"""
+        With quiet=True the downloader's own output is discarded so parallel
+        batch workers don't interleave their progress bars on one terminal.
+        """
         try:
             print(f"🚀 Starting download...")
             print(f"📁 Output: {output_file}")
 
-            # Run the command
-            result = subprocess.run(
-                command,
-                capture_output=False,  # Show live output
-                text=True,
-                timeout=3600  # 1 hour timeout
-            )
+            # Run the command, showing live output unless running quietly
+            stream = subprocess.DEVNULL if quiet else None
+            process = subprocess.Popen(command, stdin=stream, stdout=stream, stderr=stream)
+            try:
+                returncode = process.wait(timeout=3600)  # 1 hour timeout
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
 
-            if result.returncode == 0:
-                if Path(output_file).exists():
-                    file_size = Path(output_file).stat().st_size
-                    print(f"✅ Download completed successfully!")
-                    print(f"📊 File size: {file_size / (1024 * 1024):.2f} MB")
-                    return True
-                else:
+            if returncode == 0:
+                try:
+                    file_size = os.stat(output_file).st_size
+                except FileNotFoundError:
                     print("❌ Download command succeeded but file not found")
                     return False
+                print(f"✅ Download completed successfully!")
+                print(f"📊 File size: {file_size / (1024 * 1024):.2f} MB")
+                return True
             else:
-                print(f"❌ Download failed with return code: {result.returncode}")
+                print(f"❌ Download failed with return code: {returncode}")
                 return False
 
         except subprocess.TimeoutExpired:
@@ -205,21 +306,80 @@ class TLDVDownloader:
         """Save meeting metadata as JSON"""
         json_file = f"{filename}.json"
         try:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            payload = None
+            if orjson is not None:
+                try:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                except orjson.JSONEncodeError:
+                    pass  # e.g. integers beyond 64 bits; the stdlib encoder handles these
+            if payload is None:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(json_file, 'wb') as f:
+                f.write(payload)
             print(f"💾 Metadata saved: {json_file}")
         except Exception as e:
             print(f"⚠️ Could not save metadata: {e}")
 
-    def download_multiple_videos(self, video_data_list, output_dir=None, max_workers=3):
-        """Download multiple videos in parallel"""
+    def resolve_meeting(self, url, auth_token):
+        """Fetch and parse meeting information for a TLDV URL"""
+        meeting_id = self.extract_meeting_id(url)
+        auth_token = self.prepare_auth_token(auth_token)
+
+        print(f"🔍 Meeting ID: {meeting_id}")
+        print("📡 Fetching meeting data...")
+        data = self.fetch_meeting_data(meeting_id, auth_token)
+        return self.parse_meeting_info(data)
+
+    def _write_queued_metadata(self, metadata_queue):
+        """Save queued (data, filename) metadata items until a None sentinel arrives"""
+        while True:
+            item = metadata_queue.get()
+            if item is None:
+                return
+            self.save_metadata(*item)
+
+    def _download_meeting(self, info, output_path, quiet=False, thread_count=None, metadata_queue=None):
+        """Save metadata and download the video for parsed meeting information
+
+        If metadata_queue is given, metadata is handed to a background writer
+        instead of being written before the download starts.
+        """
+        # Prepare output filenames
+        base_name = f"{info['timestamp']}_{info['name']}"
+        output_file = output_path / f"{base_name}.mp4"
+
+        # Check available downloader
+        downloader = self.check_downloader_availability()
+        print(f"🔧 Using {downloader['name']} for download")
+
+        # Save metadata
+        if metadata_queue is not None:
+            metadata_queue.put((info['full_data'], output_path / base_name))
+        else:
+            self.save_metadata(info['full_data'], output_path / base_name)
+
+        # Download video
+        if downloader['name'] == 'N_m3u8DL-RE':
+            success = self.download_with_n_m3u8dl_re(info['source_url'], output_file, quiet, thread_count)
+        else:
+            success = self.download_with_ffmpeg(info['source_url'], output_file, quiet)
+
+        return str(output_file) if success else None
+
+    def download_multiple_videos(self, video_data_list, output_dir=None, max_workers=None):
+        """Download multiple videos in parallel, returning (successful, failed) result lists"""
         if not video_data_list:
             print("❌ No videos to download")
-            return []
+            return [], []
 
-        # Setup output directory
+        # Workers mostly wait on downloader subprocesses, so scale past the CPU count
+        if not max_workers:
+            max_workers = max(os.cpu_count() or 1, _MIN_DEFAULT_WORKERS)
+        max_workers = min(len(video_data_list), max_workers)
+
+        # Setup output directory once for the whole batch; workers reuse the prepared path
         if output_dir:
-            output_path = Path(output_dir)
+            output_path = Path(output_dir).resolve()
             output_path.mkdir(parents=True, exist_ok=True)
         else:
             output_path = Path.cwd()
@@ -228,16 +388,58 @@ class TLDVDownloader:
         print(f"🔧 Using {max_workers} parallel workers")
         print(f"📁 Output directory: {output_path}")
 
+        # Probe the downloaders once up front; workers reuse the cached result
+        try:
+            self.check_downloader_availability()
+        except RuntimeError as e:
+            print(f"❌ Error: {e}")
+            return [], []
+
         successful_downloads = []
         failed_downloads = []
 
-        def download_single(video_data):
-            """Download a single video - thread-safe wrapper"""
+        # Resolve every meeting concurrently before starting any downloader, sharing one
+        # pooled session so connections to the API are reused
+        fetch_workers = min(len(video_data_list), _MAX_METADATA_WORKERS)
+        self.configure_connection_pool(fetch_workers)
+        self.warm_up_connection()
+
+        def resolve_single(video_data):
+            """Fetch meeting info for a single URL - thread-safe wrapper"""
             url, auth_token = video_data
             try:
-                # Create a new session for each thread
-                thread_downloader = TLDVDownloader()
-                result = thread_downloader.download_video(url, auth_token, output_path)
+                return {'success': True, 'url': url, 'info': self.resolve_meeting(url, auth_token)}
+            except Exception as e:
+                return {'success': False, 'url': url, 'error': str(e)}
+
+        print(f"📡 Fetching meeting data for {len(video_data_list)} videos...")
+        resolved_meetings = []
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            for result in executor.map(resolve_single, video_data_list):
+                if result['success']:
+                    resolved_meetings.append(result)
+                    print(f"🎬 Found: {result['info']['name']} ({result['url']})")
+                else:
+                    failed_downloads.append(result)
+                    print(f"❌ Failed: {result['url']} - {result['error']}")
+
+        # Write metadata on a background thread so workers go straight to their downloader
+        metadata_queue = queue.Queue()
+        metadata_writer = threading.Thread(
+            target=self._write_queued_metadata, args=(metadata_queue,), daemon=True
+        )
+
+        # Split the segment thread budget between parallel downloaders so they don't thrash
+        thread_count = max(4, _MAX_SEGMENT_THREADS // max_workers)
+
+        def download_single(resolved):
+            """Download a single resolved meeting - thread-safe wrapper"""
+            url = resolved['url']
+            try:
+                result = self._download_meeting(
+                    resolved['info'], output_path, quiet=True, thread_count=thread_count,
+                    metadata_queue=metadata_queue
+                )
                 if result:
                     return {'success': True, 'url': url, 'file': result}
                 else:
@@ -245,28 +447,31 @@ class TLDVDownloader:
             except Exception as e:
                 return {'success': False, 'url': url, 'error': str(e)}
 
-        # Execute parallel downloads
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all download tasks
-            future_to_url = {
-                executor.submit(download_single, video_data): video_data[0]
-                for video_data in video_data_list
-            }
-
-            # Process completed downloads
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+        metadata_writer.start()
+        try:
+            # Execute parallel downloads
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all download tasks
+                futures = [executor.submit(download_single, resolved) for resolved in resolved_meetings]
+
+                # Process completed downloads (download_single reports its own errors)
                 try:
-                    result = future.result()
-                    if result['success']:
-                        successful_downloads.append(result)
-                        print(f"✅ Completed: {url}")
-                    else:
-                        failed_downloads.append(result)
-                        print(f"❌ Failed: {url} - {result.get('error', 'Unknown error')}")
-                except Exception as e:
-                    failed_downloads.append({'success': False, 'url': url, 'error': str(e)})
-                    print(f"💥 Exception for {url}: {e}")
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result['success']:
+                            successful_downloads.append(result)
+                            print(f"✅ Completed: {result['url']}")
+                        else:
+                            failed_downloads.append(result)
+                            print(f"❌ Failed: {result['url']} - {result.get('error', 'Unknown error')}")
+                except KeyboardInterrupt:
+                    # Drop downloads that haven't started yet instead of waiting for them
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            metadata_queue.put(None)
+            metadata_writer.join()
 
         # Summary
         print(f"\n📊 Download Summary:")
@@ -283,6 +488,31 @@ class TLDVDownloader:
             for download in failed_downloads:
                 print(f"   ❌ {download['url']}: {download['error']}")
 
+        self.save_failed_urls(failed_downloads, output_path / _FAILED_URLS_FILENAME)
+
+        return successful_downloads, failed_downloads
+
+    def save_failed_urls(self, failed_downloads, file_path):
+        """Record failed URLs in a file that can be fed back into batch mode"""
+        if not failed_downloads:
+            if file_path.exists():
+                # Left alone on purpose - it may belong to an unrelated earlier batch
+                print(f"ℹ️ No failures this run, but an older retry list exists: {file_path}")
+                print("   Delete it once those URLs are downloaded so it isn't re-run by mistake")
+            return
+        try:
+            lines = [
+                "# Failed TLDV downloads - use this file as batch input to retry them",
+                "# Each URL follows its error; delete entries that can't succeed (e.g. not found)"
+            ]
+            for download in failed_downloads:
+                error = ' '.join(str(download.get('error', 'Unknown error')).split())
+                lines += ["", f"# {error}", download['url']]
+            file_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+            print(f"📝 Failed URLs saved for retry: {file_path}")
+        except OSError as e:
+            print(f"⚠️ Could not save failed URLs: {e}")
+
     def download_video(self, url, auth_token, output_dir=None):
         """Main download function"""
         try:
@@ -293,43 +523,20 @@ class TLDVDownloader:
             else:
                 output_path = Path.cwd()
 
-            # Extract meeting ID and prepare auth token
-            meeting_id = self.extract_meeting_id(url)
-            auth_token = self.prepare_auth_token(auth_token)
-
-            print(f"🔍 Meeting ID: {meeting_id}")
             print(f"📁 Output directory: {output_path}")
 
-            # Fetch meeting data
-            print("📡 Fetching meeting data...")
-            data = self.fetch_meeting_data(meeting_id, auth_token)
-
-            # Parse meeting information
-            info = self.parse_meeting_info(data)
+            # Fetch and parse meeting information
+            info = self.resolve_meeting(url, auth_token)
 
             print(f"🎬 Title: {info['name']}")
             print(f"📅 Date: {info['timestamp']}")
 
-            # Prepare output filename
-            output_file = output_path / f"{info['timestamp']}_{info['name']}.mp4"
-
-            # Check available downloader
-            downloader = self.check_downloader_availability()
-            print(f"🔧 Using {downloader['name']} for download")
+            # Save metadata and download video
+            result = self._download_meeting(info, output_path)
 
-            # Save metadata
-            metadata_name = f"{info['timestamp']}_{info['name']}"
-            self.save_metadata(info['full_data'], output_path / metadata_name)
-
-            # Download video
-            if downloader['name'] == 'N_m3u8DL-RE':
-                success = self.download_with_n_m3u8dl_re(info['source_url'], output_file)
-            else:
-                success = self.download_with_ffmpeg(info['source_url'], output_file)
-
-            if success:
-                print(f"\n🎉 Successfully downloaded: {output_file}")
-                return str(output_file)
+            if result:
+                print(f"\n🎉 Successfully downloaded: {result}")
+                return result
             else:
                 print(f"\n💥 Failed to download video")
                 return None
@@ -371,14 +578,10 @@ Alternative method:
 
 def parse_urls_from_file(file_path):
     """Parse URLs from a text file (one URL per line)"""
-    urls = []
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):  # Skip empty lines and comments
-                    urls.append(line)
-        return urls
+        text = Path(file_path).read_text(encoding='utf-8-sig', errors='replace')
+        # Skip empty lines and comments
+        return [line for line in map(str.strip, text.splitlines()) if line and not line.startswith('#')]
     except Exception as e:
         print(f"❌ Error reading file {file_path}: {e}")
         return []
@@ -446,17 +649,17 @@ def main():
                 output_dir = None
 
             # Parallel workers
-            max_workers = input(f"\n🔧 Number of parallel downloads (1-8, default 3): ").strip()
+            max_workers = input(f"\n🔧 Number of parallel downloads (press Enter for auto): ").strip()
             try:
-                max_workers = max(1, min(8, int(max_workers))) if max_workers else 3
+                max_workers = max(1, int(max_workers)) if max_workers else None
             except ValueError:
-                max_workers = 3
+                max_workers = None
 
             # Confirm before download
             print(f"\n📋 Ready for batch download:")
             print(f"   URLs: {len(urls)} videos")
             print(f"   Output: {output_dir or 'Current directory'}")
-            print(f"   Parallel workers: {max_workers}")
+            print(f"   Parallel workers: {max_workers or 'Auto'}")
 
             confirm = input("\n❓ Proceed with batch download? (y/N): ").strip().lower()
             if confirm != 'y':
@@ -468,10 +671,12 @@ def main():
 
             # Start batch download
             print("\n" + "=" * 55)
-            results = downloader.download_multiple_videos(video_data_list, output_dir, max_workers)
+            successful, failed = downloader.download_multiple_videos(video_data_list, output_dir, max_workers)
 
-            if results:
-                print(f"\n🎉 Batch download completed! {len(results)} videos downloaded.")
+            if successful and not failed:
+                print(f"\n🎉 Batch download completed! {len(successful)} videos downloaded.")
+            elif successful:
+                print(f"\n⚠️ Batch download partially completed: {len(successful)} downloaded, {len(failed)} failed.")
             else:
                 print("\n💥 Batch download failed!")
 